@@ -0,0 +1,195 @@
+"""LLM-backed answering of prior authorization questions.
+
+All visible questions for a patient are answered in a single LLM call: the
+patient record is sent once and every question is listed with its key, and
+the model returns one structured answer per key. Conditional questions
+(``visible_if``) are resolved in Python against the returned answers.
+"""
+
+import re
+from functools import lru_cache
+
+import logfire
+from pydantic import BaseModel, Field
+from pydantic_ai import Agent
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from app.env import get_openai_api_key
+from app.models import Answer, Patient, Question
+
+logger = logfire
+
+ANSWER_MODEL = "gpt-4.1"
+
+# Matches a single ``{key} = value`` clause of a ``visible_if`` expression
+_CONDITION_PATTERN = re.compile(
+    r"^\{(?P<key>[^{}]+)\}\s*=\s*(?P<value>[^{}()=!<>|&]+)$"
+)
+
+# String answers accepted for boolean questions
+_BOOLEAN_VALUES = {"true": True, "yes": True, "false": False, "no": False}
+
+SYSTEM_PROMPT = """You are a clinical assistant filling out pharmacy prior authorization forms.
+
+You will be given a patient record (demographics, prescription and visit notes) followed by
+a numbered list of form questions. Answer every question using only the information in the
+patient record.
+
+Rules:
+- Return exactly one answer per question, identified by the question's key.
+- For "boolean" questions the value must be true or false.
+- For "text" questions the value must be a short string, including units where relevant.
+- Some questions are only shown when a condition on other answers holds; answer them anyway
+  so they are available if the condition is met.
+- If the record does not contain the information, answer false for boolean questions and
+  "Unknown" for text questions.
+"""
+
+
+class GeneratedAnswer(BaseModel):
+    """A single answer as returned by the LLM, identified by question key."""
+
+    key: str = Field(description="Key of the question being answered")
+    value: str | bool = Field(description="Answer value (bool for boolean questions)")
+
+
+@lru_cache(maxsize=1)
+def get_answer_agent() -> Agent[None, list[GeneratedAnswer]]:
+    """Get the shared agent used to answer question sets.
+
+    Returns:
+        Agent producing a list of answers keyed by question key
+    """
+    model = OpenAIModel(
+        ANSWER_MODEL, provider=OpenAIProvider(api_key=get_openai_api_key())
+    )
+    return Agent(
+        model,
+        output_type=list[GeneratedAnswer],
+        system_prompt=SYSTEM_PROMPT,
+        instrument=True,
+    )
+
+
+def build_prompt(patient: Patient, questions: list[Question]) -> str:
+    """Build the user prompt containing the patient record and all questions.
+
+    Args:
+        patient: Patient whose record is used to answer the questions
+        questions: Questions to answer
+
+    Returns:
+        Prompt with the patient record followed by the numbered questions
+    """
+    prescription = patient.prescription
+    visit_notes = "\n\n".join(
+        f"--- Visit note {i} ---\n{note}"
+        for i, note in enumerate(patient.visit_notes, start=1)
+    )
+    question_lines = "\n".join(
+        f"{i}. [key={q.key}] [type={q.type}] {q.content}"
+        + (f" (only shown if {q.visible_if})" if q.visible_if else "")
+        for i, q in enumerate(questions, start=1)
+    )
+
+    return f"""Patient record:
+- Name: {patient.first_name} {patient.last_name}
+- Date of Birth: {patient.date_of_birth}
+- Gender: {patient.gender}
+- Prescription: {prescription.medication} {prescription.dosage}, {prescription.frequency}, {prescription.duration}
+
+Visit notes:
+{visit_notes}
+
+Questions:
+{question_lines}
+"""
+
+
+def is_visible(question: Question, values: dict[str, str | bool]) -> bool:
+    """Evaluate a question's ``visible_if`` condition against known answers.
+
+    Conditions are ``and``-joined clauses of the form ``{key} = value``. A clause
+    referencing a question without an answer evaluates to false. Conditions in
+    any other form cannot be evaluated, so the question is treated as visible.
+
+    Args:
+        question: Question whose visibility is checked
+        values: Answer values of visible questions, by question key
+
+    Returns:
+        Whether the question should be shown and answered
+    """
+    if not question.visible_if:
+        return True
+
+    for clause in question.visible_if.split(" and "):
+        match = _CONDITION_PATTERN.match(clause.strip())
+        if match is None:
+            logger.warning(
+                "Unsupported visible_if condition on {key}, treating as visible: "
+                "{visible_if}",
+                key=question.key,
+                visible_if=question.visible_if,
+            )
+            return True
+
+        actual = values.get(match["key"])
+        if actual is None:
+            return False
+
+        expected = match["value"].strip().strip("\"'")
+        if isinstance(actual, bool):
+            if expected.lower() not in ("true", "false"):
+                return False
+            if actual != (expected.lower() == "true"):
+                return False
+        elif str(actual).strip().lower() != expected.lower():
+            return False
+
+    return True
+
+
+async def answer_questions(patient: Patient, questions: list[Question]) -> list[Answer]:
+    """Answer a list of questions for a patient with a single LLM call.
+
+    Args:
+        patient: Patient whose record is used to answer the questions
+        questions: Questions to answer, in form order
+
+    Returns:
+        Answers for the visible questions, in form order. Boolean answers the
+        LLM gave as anything but yes/no or true/false are omitted
+    """
+    if not questions:
+        return []
+
+    result = await get_answer_agent().run(build_prompt(patient, questions))
+    generated = {answer.key: answer.value for answer in result.output}
+
+    answers = []
+    values: dict[str, str | bool] = {}
+    # Questions only depend on earlier ones, so a single ordered pass resolves them
+    for question in questions:
+        if question.key not in generated or not is_visible(question, values):
+            continue
+
+        value = generated[question.key]
+        if question.type == "boolean" and isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized not in _BOOLEAN_VALUES:
+                logger.warning(
+                    "Dropping non-boolean answer to {key}: {value}",
+                    key=question.key,
+                    value=value,
+                )
+                continue
+            value = _BOOLEAN_VALUES[normalized]
+        elif question.type == "text" and isinstance(value, bool):
+            value = str(value).lower()
+
+        values[question.key] = value
+        answers.append(Answer(question=question, value=value))
+
+    return answers
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 
 from app.env import setup_env
 
+from .llm import answer_questions
 from .models import AnswerInput, AnswerOutput
 
 setup_env()
@@ -32,7 +33,9 @@ async def get_answers(data: AnswerInput) -> AnswerOutput:
     This endpoint accepts patient information and a list of questions,
     then uses LLM to generate appropriate answers based on the patient's
     medical history, current medications, and other relevant data.
+
+    All questions are answered in a single LLM call; answers to questions
+    hidden by their `visible_if` condition are dropped.
     """
-    ## TODO: Implement your logic here
-    # Example response structure - replace with actual LLM implementation
-    return AnswerOutput(answers=[])
+    answers = await answer_questions(data.patient, data.question_set.questions)
+    return AnswerOutput(answers=answers)
@@ -10,6 +10,7 @@ Example:
         $ python scripts/generate_patient_data.py
         $ python scripts/generate_patient_data.py -n 10
         $ python scripts/generate_patient_data.py --number 5 --output custom_patients.json
+        $ python scripts/generate_patient_data.py -n 1000 --batch
 
     Or use programmatically::
 
@@ -20,17 +21,36 @@ Example:
 
 import argparse
 import asyncio
-import json
+import os
 import random
+import time
+from collections.abc import AsyncIterator, Coroutine
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
 
 import logfire
+import numpy as np
+import orjson
 from faker import Faker
+from openai import AsyncOpenAI, OpenAIError
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
 from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.providers.openai import OpenAIProvider
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 from app.env import get_openai_api_key, setup_env
 from app.models import Patient, Prescription
@@ -39,6 +59,8 @@ from app.models import Patient, Prescription
 setup_env()
 logger = logfire
 
+T = TypeVar("T")
+
 # Constants
 MIN_PATIENT_AGE = 18
 MAX_PATIENT_AGE = 75
@@ -47,6 +69,20 @@ MAX_VISITS = 4
 DAYS_BETWEEN_VISITS = 30
 MAX_MONTHS_ON_MEDICATION = 24
 VISIT_NOTE_PREVIEW_LENGTH = 500
+MAX_CONCURRENT_REQUESTS = 16
+MAX_REQUEST_ATTEMPTS = 8
+NAME_POOL_SIZE = 2000
+VISIT_NOTE_MODEL = "gpt-4.1"
+FOLLOW_UP_VISIT_NOTE_MODEL = "gpt-4o-mini"
+MIN_VISIT_NOTE_LENGTH = 500
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SECONDS = 30
+# Give up on a batch a little after its completion window has passed
+BATCH_TIMEOUT_SECONDS = 25 * 60 * 60
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+# OpenAI Batch API limits per batch
+MAX_BATCH_REQUESTS = 50_000
+MAX_BATCH_FILE_BYTES = 200 * 1024 * 1024
 
 
 class MedicationInfo(BaseModel):
@@ -74,6 +110,33 @@ MEDICATIONS: dict[str, MedicationInfo] = {
         duration="ongoing",
     ),
 }
+MEDICATION_NAMES = tuple(MEDICATIONS)
+
+# Patient details come first and are identical across a patient's visits; only
+# the trailing visit details vary, keeping the shared prefix cacheable
+VISIT_PROMPT_TEMPLATE = """Generate a realistic doctor's visit note for this patient:
+        - Patient Name: {first_name} {last_name}
+        - Date of Birth: {date_of_birth}
+        - Age: {age} years old
+        - Gender: {gender}
+        - Medication: {medication} {dosage}
+        - Frequency: {frequency}
+        - Duration: {duration}
+        - Is Continuation: {is_continuation}
+        - Months on Medication: {months_on_medication}
+        - Visit Date: {visit_date}
+        - Visit Number: {visit_number} of {total_visits}
+
+        This is visit {visit_number}. {visit_type}
+        """
+
+
+class Demographics(NamedTuple):
+    """Randomly sampled patient demographics."""
+
+    gender: str
+    age: int
+    date_of_birth: str
 
 
 class VisitNoteRequest(BaseModel):
@@ -96,45 +159,34 @@ class VisitNoteRequest(BaseModel):
     )
 
 
-class PatientDataGenerator:
-    """Handles generation of synthetic patient data with AI-powered visit notes.
+def _is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an error is an HTTP 429 response from the model provider.
 
-    This class encapsulates the logic for creating realistic patient records
-    including demographics, prescriptions, and medical visit notes.
+    Args:
+        error: Exception raised by an agent run
 
-    Attributes:
-        faker: Faker instance for generating demographic data
-        visit_note_agent: AI agent for generating medical notes
+    Returns:
+        Whether the request should be retried after backing off
     """
+    return isinstance(error, ModelHTTPError) and error.status_code == 429
 
-    def __init__(self) -> None:
-        """Initialize the patient data generator."""
-        self.faker = Faker()
-        self._setup_ai_agent()
 
-    def _setup_ai_agent(self) -> None:
-        """Configure the AI agent for generating visit notes."""
-        try:
-            api_key = get_openai_api_key()
-            model = OpenAIModel("gpt-4.1", provider=OpenAIProvider(api_key=api_key))
+def _get_system_prompt() -> str:
+    """Get the system prompt shared by the visit note agents and batch requests.
 
-            self.visit_note_agent = Agent(
-                model,
-                system_prompt=self._get_system_prompt(),
-                instrument=True,
-            )
-        except Exception as e:
-            logger.exception("Failed to initialize AI agent")
-            raise RuntimeError("Could not initialize AI agent") from e
+    Everything that does not vary between requests lives here, including the
+    medication reference table, so OpenAI's prompt caching can reuse it.
 
-    @staticmethod
-    def _get_system_prompt() -> str:
-        """Get the system prompt for the visit note agent.
+    Returns:
+        Detailed system prompt for generating medical visit notes
+    """
+    medication_table = "\n".join(
+        f"        - {name}: dosages {', '.join(info.dosages)}; "
+        f"{info.frequency}; {info.duration}"
+        for name, info in MEDICATIONS.items()
+    )
 
-        Returns:
-            Detailed system prompt for generating medical visit notes
-        """
-        return """You are a medical professional writing detailed visit notes for patients being prescribed weight management or autoimmune medications.
+    return f"""You are a medical professional writing detailed visit notes for patients being prescribed weight management or autoimmune medications.
 
         Generate realistic doctor's visit notes that include:
         1. Patient vital signs (weight, height, BMI)
@@ -154,8 +206,85 @@ class PatientDataGenerator:
         - Patient adherence and response to treatment
 
         The notes should naturally incorporate answers to medication authorization questions without being a direct Q&A format.
+
+        Always include the patient's details given in the request in the note. Do not redact anything.
+
+        Medication reference:
+{medication_table}
         """
 
+
+@lru_cache(maxsize=2)
+def _get_visit_note_agent(model_name: str) -> Agent[None, str]:
+    """Get the shared AI agent for generating visit notes.
+
+    The agent is built once per model and process so every generator reuses
+    the same OpenAI client and its connection pool.
+
+    Args:
+        model_name: OpenAI model used to generate the notes
+
+    Returns:
+        Agent configured with the visit note system prompt
+
+    Raises:
+        RuntimeError: If the agent cannot be initialized
+    """
+    try:
+        api_key = get_openai_api_key()
+        model = OpenAIModel(model_name, provider=OpenAIProvider(api_key=api_key))
+
+        return Agent(
+            model,
+            system_prompt=_get_system_prompt(),
+            instrument=True,
+        )
+    except Exception as e:
+        logger.exception("Failed to initialize AI agent")
+        raise RuntimeError("Could not initialize AI agent") from e
+
+
+class PatientDataGenerator:
+    """Handles generation of synthetic patient data with AI-powered visit notes.
+
+    This class encapsulates the logic for creating realistic patient records
+    including demographics, prescriptions, and medical visit notes.
+
+    Attributes:
+        faker: Faker instance for generating demographic data
+        visit_note_agent: AI agent for generating initial consultation notes
+        follow_up_agent: Smaller, faster AI agent for generating follow-up notes
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        expected_patients: int = NAME_POOL_SIZE,
+    ) -> None:
+        """Initialize the patient data generator.
+
+        Args:
+            max_concurrent: Maximum number of in-flight visit note requests
+            expected_patients: Number of patients this generator will create,
+                used to size the name pools
+        """
+        self.faker = Faker()
+        # Dates are relative to one timestamp captured per generator run
+        self._now = datetime.now()
+        # Sample name pools once; per-patient Faker calls are comparatively slow.
+        # No run needs more names per pool than it has patients.
+        pool_size = max(1, min(expected_patients, NAME_POOL_SIZE))
+        self._male_first_names = [
+            self.faker.first_name_male() for _ in range(pool_size)
+        ]
+        self._female_first_names = [
+            self.faker.first_name_female() for _ in range(pool_size)
+        ]
+        self._last_names = [self.faker.last_name() for _ in range(pool_size)]
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.visit_note_agent = _get_visit_note_agent(VISIT_NOTE_MODEL)
+        self.follow_up_agent = _get_visit_note_agent(FOLLOW_UP_VISIT_NOTE_MODEL)
+
     async def generate_visit_notes(self, patient_info: VisitNoteRequest) -> list[str]:
         """Generate realistic medical visit notes for a patient.
 
@@ -171,29 +300,158 @@ class PatientDataGenerator:
         Raises:
             RuntimeError: If AI agent fails to generate notes
         """
-        num_notes = random.randint(MIN_VISITS, MAX_VISITS)
-        notes = []
-
-        for visit_number in range(num_notes):
-            try:
-                visit_date = self._calculate_visit_date(visit_number)
-                prompt = self._create_visit_prompt(
-                    patient_info, visit_date, visit_number + 1, num_notes
+        prompts = self.build_visit_prompts(patient_info)
+        follow_ups = [
+            visit_index
+            for visit_index in range(len(prompts))
+            if not self._is_initial_visit(patient_info, visit_index)
+        ]
+
+        # Notes are independent of each other, so generate them concurrently.
+        # Follow-ups are mostly routine and use the smaller model.
+        notes = await self._run_visit_note_agents(
+            [
+                (
+                    visit_index,
+                    self.follow_up_agent
+                    if visit_index in follow_ups
+                    else self.visit_note_agent,
+                    prompt,
                 )
+                for visit_index, prompt in enumerate(prompts)
+            ]
+        )
+
+        # Regenerate follow-ups that fail the quality check with the larger model
+        rejected = [
+            i
+            for i in follow_ups
+            if not self._is_acceptable_note(patient_info, notes[i])
+        ]
+        if rejected:
+            logger.warning(
+                "{count} follow-up notes failed quality check, regenerating with "
+                "{model}",
+                count=len(rejected),
+                model=VISIT_NOTE_MODEL,
+            )
+            regenerated = await self._run_visit_note_agents(
+                [(i, self.visit_note_agent, prompts[i]) for i in rejected]
+            )
+            for visit_index, note in zip(rejected, regenerated, strict=True):
+                notes[visit_index] = note
+
+        return notes
 
-                result = await self.visit_note_agent.run(prompt)
-                notes.append(result.output)
+    async def _run_visit_note_agents(
+        self, requests: list[tuple[int, Agent[None, str], str]]
+    ) -> list[str]:
+        """Run several visit note requests concurrently.
 
-            except Exception as e:
-                logger.error(f"Failed to generate visit note {visit_number + 1}: {e}")
+        Args:
+            requests: Tuples of (visit_index, agent, prompt) to run
+
+        Returns:
+            Generated visit notes, in the order of the requests
+
+        Raises:
+            RuntimeError: If any of the notes fails to generate
+        """
+        results = await asyncio.gather(
+            *(
+                self._run_visit_note_agent(agent, prompt)
+                for _, agent, prompt in requests
+            ),
+            return_exceptions=True,
+        )
+
+        notes = []
+        for (visit_index, _, _), result in zip(requests, results, strict=True):
+            visit_number = visit_index + 1
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to generate visit note {visit_number}: {result}")
                 raise RuntimeError(
-                    f"Could not generate visit note {visit_number + 1}"
-                ) from e
+                    f"Could not generate visit note {visit_number}"
+                ) from result
+            notes.append(result)
 
         return notes
 
+    def build_visit_prompts(self, patient_info: VisitNoteRequest) -> list[str]:
+        """Build the prompts for a patient's 2-4 visit notes.
+
+        Args:
+            patient_info: Patient information and prescription details
+
+        Returns:
+            One prompt per visit, in chronological order
+        """
+        num_notes = random.randint(MIN_VISITS, MAX_VISITS)
+        return [
+            self._create_visit_prompt(
+                patient_info,
+                self._calculate_visit_date(visit_number),
+                visit_number + 1,
+                num_notes,
+            )
+            for visit_number in range(num_notes)
+        ]
+
     @staticmethod
-    def _calculate_visit_date(visit_index: int) -> datetime:
+    def _is_initial_visit(patient_info: VisitNoteRequest, visit_index: int) -> bool:
+        """Determine whether a visit is the initial consultation.
+
+        Args:
+            patient_info: Patient information and prescription details
+            visit_index: Zero-based index of the visit
+
+        Returns:
+            Whether this is the consultation for starting the medication
+        """
+        return visit_index == 0 and not patient_info.is_continuation
+
+    @staticmethod
+    def _is_acceptable_note(patient_info: VisitNoteRequest, note: str) -> bool:
+        """Check that a generated note is long enough and names the patient.
+
+        Args:
+            patient_info: Patient information and prescription details
+            note: Generated visit note
+
+        Returns:
+            Whether the note passes the quality check
+        """
+        return (
+            len(note) >= MIN_VISIT_NOTE_LENGTH
+            and patient_info.patient_last_name in note
+        )
+
+    @retry(
+        retry=retry_if_exception(_is_rate_limit_error),
+        wait=wait_random_exponential(min=1, max=60),
+        stop=stop_after_attempt(MAX_REQUEST_ATTEMPTS),
+        reraise=True,
+    )
+    async def _run_visit_note_agent(self, agent: Agent[None, str], prompt: str) -> str:
+        """Run a visit note agent with bounded concurrency.
+
+        The note is streamed and accumulated chunk by chunk rather than waiting
+        for the whole completion. Rate-limited requests are retried with
+        randomized exponential backoff.
+
+        Args:
+            agent: Agent to run
+            prompt: Prompt for a single visit note
+
+        Returns:
+            Generated visit note
+        """
+        async with self._semaphore:
+            async with agent.run_stream(prompt) as stream:
+                chunks = [chunk async for chunk in stream.stream_text(delta=True)]
+        return "".join(chunks)
+
+    def _calculate_visit_date(self, visit_index: int) -> datetime:
         """Calculate the date for a specific visit.
 
         Args:
@@ -205,7 +463,7 @@ class PatientDataGenerator:
         days_ago = random.randint(
             DAYS_BETWEEN_VISITS * visit_index, DAYS_BETWEEN_VISITS * (visit_index + 1)
         )
-        return datetime.now() - timedelta(days=days_ago)
+        return self._now - timedelta(days=days_ago)
 
     @staticmethod
     def _create_visit_prompt(
@@ -227,32 +485,86 @@ class PatientDataGenerator:
         """
         visit_type = (
             "This is the initial consultation for starting the medication."
-            if visit_number == 1 and not patient_info.is_continuation
+            if PatientDataGenerator._is_initial_visit(patient_info, visit_number - 1)
             else "This is a follow-up visit."
         )
 
-        return f"""Generate a realistic doctor's visit note for this patient. Ensure the patient's details are included in the notes. Do not redact anything:
-        - Patient Name: {patient_info.patient_first_name} {patient_info.patient_last_name}
-        - Date of Birth: {patient_info.patient_date_of_birth}
-        - Age: {patient_info.patient_age} years old
-        - Gender: {patient_info.patient_gender}
-        - Medication: {patient_info.medication} {patient_info.dosage}
-        - Frequency: {patient_info.frequency}
-        - Duration: {patient_info.duration}
-        - Visit Date: {visit_date.strftime("%Y-%m-%d")}
-        - Visit Number: {visit_number} of {total_visits}
-        - Is Continuation: {patient_info.is_continuation}
-        - Months on Medication: {patient_info.months_on_medication if patient_info.is_continuation else "N/A"}
+        return VISIT_PROMPT_TEMPLATE.format(
+            first_name=patient_info.patient_first_name,
+            last_name=patient_info.patient_last_name,
+            date_of_birth=patient_info.patient_date_of_birth,
+            age=patient_info.patient_age,
+            gender=patient_info.patient_gender,
+            medication=patient_info.medication,
+            dosage=patient_info.dosage,
+            frequency=patient_info.frequency,
+            duration=patient_info.duration,
+            is_continuation=patient_info.is_continuation,
+            months_on_medication=(
+                patient_info.months_on_medication
+                if patient_info.is_continuation
+                else "N/A"
+            ),
+            total_visits=total_visits,
+            visit_date=visit_date.strftime("%Y-%m-%d"),
+            visit_number=visit_number,
+            visit_type=visit_type,
+        )
 
-        This is visit {visit_number}. {visit_type}
+    def build_visit_note_request(
+        self, demographics: Demographics | None = None
+    ) -> tuple[VisitNoteRequest, Prescription]:
+        """Generate a name and prescription for a new patient.
+
+        Args:
+            demographics: Pre-sampled demographics. If None, samples new ones
+
+        Returns:
+            Tuple of (VisitNoteRequest, Prescription object)
         """
+        # Generate demographics
+        if demographics is None:
+            demographics = self._sample_demographics(1)[0]
+        gender, age, date_of_birth = demographics
+        first_name = self._get_gender_appropriate_name(gender)
+        last_name = random.choice(self._last_names)
+
+        # Generate prescription
+        medication, dosage, prescription = self._generate_prescription()
+
+        # Determine treatment status
+        is_continuation = self._should_be_continuation(medication)
+        months_on_medication = (
+            random.randint(1, MAX_MONTHS_ON_MEDICATION) if is_continuation else None
+        )
 
-    def generate_patient(self) -> Patient:
+        visit_note_request = VisitNoteRequest(
+            patient_first_name=first_name,
+            patient_last_name=last_name,
+            patient_age=age,
+            patient_gender=gender,
+            patient_date_of_birth=date_of_birth,
+            medication=medication,
+            dosage=dosage,
+            frequency=prescription.frequency,
+            duration=prescription.duration,
+            is_continuation=is_continuation,
+            months_on_medication=months_on_medication,
+        )
+
+        return visit_note_request, prescription
+
+    async def generate_patient(
+        self, demographics: Demographics | None = None
+    ) -> Patient:
         """Generate a single patient with complete medical records.
 
         Creates a patient with random demographics, appropriate prescription,
         and AI-generated visit notes.
 
+        Args:
+            demographics: Pre-sampled demographics. If None, samples new ones
+
         Returns:
             Complete Patient object with all fields populated
 
@@ -260,53 +572,44 @@ class PatientDataGenerator:
             RuntimeError: If patient generation fails
         """
         try:
-            # Generate demographics
-            gender = random.choice(["Male", "Female"])
-            first_name = self._get_gender_appropriate_name(gender)
-            last_name = self.faker.last_name()
-            age = random.randint(MIN_PATIENT_AGE, MAX_PATIENT_AGE)
-            date_of_birth = self._calculate_date_of_birth(age)
-
-            # Generate prescription
-            medication, dosage, prescription = self._generate_prescription()
-
-            # Determine treatment status
-            is_continuation = self._should_be_continuation(medication)
-            months_on_medication = (
-                random.randint(1, MAX_MONTHS_ON_MEDICATION) if is_continuation else None
-            )
-
-            # Create visit note request
-            visit_note_request = VisitNoteRequest(
-                patient_first_name=first_name,
-                patient_last_name=last_name,
-                patient_age=age,
-                patient_gender=gender,
-                patient_date_of_birth=date_of_birth,
-                medication=medication,
-                dosage=dosage,
-                frequency=prescription.frequency,
-                duration=prescription.duration,
-                is_continuation=is_continuation,
-                months_on_medication=months_on_medication,
+            visit_note_request, prescription = self.build_visit_note_request(
+                demographics
             )
 
-            # Generate visit notes synchronously (wrapper for async function)
-            visit_notes = asyncio.run(self.generate_visit_notes(visit_note_request))
+            # Generate visit notes asynchronously
+            visit_notes = await self.generate_visit_notes(visit_note_request)
 
-            return Patient(
-                first_name=first_name,
-                last_name=last_name,
-                date_of_birth=date_of_birth,
-                gender=gender,
-                prescription=prescription,
-                visit_notes=visit_notes,
-            )
+            return self._build_patient(visit_note_request, prescription, visit_notes)
 
         except Exception as e:
             logger.error(f"Failed to generate patient: {e}")
             raise RuntimeError("Could not generate patient") from e
 
+    @staticmethod
+    def _build_patient(
+        visit_note_request: VisitNoteRequest,
+        prescription: Prescription,
+        visit_notes: list[str],
+    ) -> Patient:
+        """Assemble a Patient from its generated attributes and visit notes.
+
+        Args:
+            visit_note_request: Demographics and treatment details of the patient
+            prescription: Patient's prescription
+            visit_notes: Generated visit notes in chronological order
+
+        Returns:
+            Complete Patient object
+        """
+        return Patient(
+            first_name=visit_note_request.patient_first_name,
+            last_name=visit_note_request.patient_last_name,
+            date_of_birth=visit_note_request.patient_date_of_birth,
+            gender=visit_note_request.patient_gender,
+            prescription=prescription,
+            visit_notes=visit_notes,
+        )
+
     def _get_gender_appropriate_name(self, gender: str) -> str:
         """Get a gender-appropriate first name.
 
@@ -316,25 +619,38 @@ class PatientDataGenerator:
         Returns:
             Appropriate first name
         """
-        return (
-            self.faker.first_name_male()
-            if gender == "Male"
-            else self.faker.first_name_female()
+        return random.choice(
+            self._male_first_names if gender == "Male" else self._female_first_names
         )
 
-    @staticmethod
-    def _calculate_date_of_birth(age: int) -> str:
-        """Calculate date of birth from age.
+    def _sample_demographics(self, n: int) -> list[Demographics]:
+        """Sample gender, age and date of birth for many patients at once.
+
+        Draws are vectorized with NumPy so large batches avoid per-patient
+        Python-level random and datetime calls.
 
         Args:
-            age: Patient age in years
+            n: Number of patients to sample
 
         Returns:
-            Date of birth in YYYY-MM-DD format
+            List of sampled demographics, dates of birth in YYYY-MM-DD format
         """
-        days_old = age * 365 + random.randint(0, 364)
-        birth_date = datetime.now() - timedelta(days=days_old)
-        return birth_date.strftime("%Y-%m-%d")
+        rng = np.random.default_rng()
+        genders = rng.choice(["Male", "Female"], n)
+        ages = rng.integers(MIN_PATIENT_AGE, MAX_PATIENT_AGE + 1, n)
+        days_old = ages * 365 + rng.integers(0, 365, n)
+        today = np.datetime64(self._now.date(), "D")
+        dates_of_birth = today - days_old.astype("timedelta64[D]")
+
+        return [
+            Demographics(gender, age, date_of_birth)
+            for gender, age, date_of_birth in zip(
+                genders.tolist(),
+                ages.tolist(),
+                dates_of_birth.astype(str).tolist(),
+                strict=True,
+            )
+        ]
 
     @staticmethod
     def _generate_prescription() -> tuple[str, str, Prescription]:
@@ -343,7 +659,7 @@ class PatientDataGenerator:
         Returns:
             Tuple of (medication_name, dosage, Prescription object)
         """
-        medication = random.choice(list(MEDICATIONS.keys()))
+        medication = random.choice(MEDICATION_NAMES)
         med_info = MEDICATIONS[medication]
         dosage = random.choice(med_info.dosages)
 
@@ -370,80 +686,297 @@ class PatientDataGenerator:
         return random.choice([True, False]) if medication != "Skyrizi" else False
 
 
-async def generate_patients_async(n: int = 10) -> list[Patient]:
-    """Generate multiple patients asynchronously for better performance.
+async def stream_patients(n: int = 10) -> AsyncIterator[Patient]:
+    """Generate multiple patients concurrently, yielding each as it completes.
 
     Args:
         n: Number of patients to generate
 
-    Returns:
-        List of generated Patient objects
+    Yields:
+        Generated Patient objects in completion order
 
     Raises:
         RuntimeError: If patient generation fails
     """
-    generator = PatientDataGenerator()
-    tasks = []
+    generator = PatientDataGenerator(expected_patients=n)
+    demographics = generator._sample_demographics(n)
 
     async def generate_single_patient(index: int) -> Patient:
         """Generate a single patient with progress logging."""
         try:
-            # Create patient info
-            gender = random.choice(["Male", "Female"])
-            first_name = generator._get_gender_appropriate_name(gender)
-            last_name = generator.faker.last_name()
-            age = random.randint(MIN_PATIENT_AGE, MAX_PATIENT_AGE)
-            date_of_birth = generator._calculate_date_of_birth(age)
-
-            medication, dosage, prescription = generator._generate_prescription()
-            is_continuation = generator._should_be_continuation(medication)
-            months_on_medication = (
-                random.randint(1, MAX_MONTHS_ON_MEDICATION) if is_continuation else None
-            )
-
-            visit_note_request = VisitNoteRequest(
-                patient_first_name=first_name,
-                patient_last_name=last_name,
-                patient_age=age,
-                patient_gender=gender,
-                patient_date_of_birth=date_of_birth,
-                medication=medication,
-                dosage=dosage,
-                frequency=prescription.frequency,
-                duration=prescription.duration,
-                is_continuation=is_continuation,
-                months_on_medication=months_on_medication,
-            )
-
-            # Generate visit notes asynchronously
-            visit_notes = await generator.generate_visit_notes(visit_note_request)
-
-            patient = Patient(
-                first_name=first_name,
-                last_name=last_name,
-                date_of_birth=date_of_birth,
-                gender=gender,
-                prescription=prescription,
-                visit_notes=visit_notes,
+            patient = await generator.generate_patient(demographics[index])
+
+            logger.info(
+                "Generated patient {index}/{n}: {first_name} {last_name}",
+                index=index + 1,
+                n=n,
+                first_name=patient.first_name,
+                last_name=patient.last_name,
             )
-
-            logger.info(f"Generated patient {index + 1}/{n}: {first_name} {last_name}")
             return patient
 
         except Exception as e:
             logger.error(f"Failed to generate patient {index + 1}: {e}")
             raise
 
-    # Create tasks for all patients
-    for i in range(n):
-        tasks.append(generate_single_patient(i))
+    # Create tasks for all patients so they run concurrently
+    tasks = [asyncio.create_task(generate_single_patient(i)) for i in range(n)]
+
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def generate_patients_async(n: int = 10) -> list[Patient]:
+    """Generate multiple patients asynchronously for better performance.
+
+    Args:
+        n: Number of patients to generate
+
+    Returns:
+        List of generated Patient objects
+
+    Raises:
+        RuntimeError: If patient generation fails
+    """
+    return [patient async for patient in stream_patients(n)]
+
+
+async def generate_patients_batch(n: int = 10) -> list[Patient]:
+    """Generate multiple patients using the OpenAI Batch API.
+
+    All visit note prompts are uploaded as JSONL batch jobs, split to stay within
+    the Batch API's per-batch limits. This is cheaper than live requests and uses
+    a separate rate limit pool, at the cost of completing asynchronously within
+    the batch completion window.
+
+    Args:
+        n: Number of patients to generate
+
+    Returns:
+        List of generated Patient objects
+
+    Raises:
+        RuntimeError: If the batch job or any of its requests fails
+    """
+    generator = PatientDataGenerator(expected_patients=n)
+    client = AsyncOpenAI(api_key=get_openai_api_key())
+    system_prompt = _get_system_prompt()
+
+    # Build every patient and visit prompt up front
+    scaffolds = []
+    lines = []
+    for patient_index, demographics in enumerate(generator._sample_demographics(n)):
+        visit_note_request, prescription = generator.build_visit_note_request(
+            demographics
+        )
+        prompts = generator.build_visit_prompts(visit_note_request)
+        scaffolds.append((visit_note_request, prescription, len(prompts)))
+
+        for visit_index, prompt in enumerate(prompts):
+            request = {
+                "custom_id": f"{patient_index}:{visit_index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": (
+                        VISIT_NOTE_MODEL
+                        if generator._is_initial_visit(visit_note_request, visit_index)
+                        else FOLLOW_UP_VISIT_NOTE_MODEL
+                    ),
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ],
+                },
+            }
+            lines.append(orjson.dumps(request))
+
+    # Large runs exceed the per-batch limits, so submit several batches at once.
+    # If any batch fails, cancel the rest rather than leave them running.
+    tasks = [
+        asyncio.create_task(_run_batch(client, batch_input))
+        for batch_input in _split_batch_input(lines)
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    notes: dict[str, str] = {}
+    for batch_notes in results:
+        notes.update(batch_notes)
+
+    patients = []
+    for patient_index, (visit_note_request, prescription, num_notes) in enumerate(
+        scaffolds
+    ):
+        visit_notes = [
+            notes[f"{patient_index}:{visit_index}"] for visit_index in range(num_notes)
+        ]
+        patients.append(
+            generator._build_patient(visit_note_request, prescription, visit_notes)
+        )
 
-    # Execute all tasks concurrently
-    patients = await asyncio.gather(*tasks)
     return patients
 
 
-def generate_patient_data(n: int = 10, output_file: str | None = None) -> list[Patient]:
+def _split_batch_input(lines: list[bytes]) -> list[bytes]:
+    """Split JSONL request lines into batch input files within API limits.
+
+    Args:
+        lines: Serialized batch requests, one per line
+
+    Returns:
+        JSONL batch input files, each within the request count and size limits
+    """
+    batch_inputs = []
+    current: list[bytes] = []
+    current_size = 0
+
+    for line in lines:
+        line_size = len(line) + 1
+        if current and (
+            len(current) >= MAX_BATCH_REQUESTS
+            or current_size + line_size > MAX_BATCH_FILE_BYTES
+        ):
+            batch_inputs.append(b"\n".join(current) + b"\n")
+            current, current_size = [], 0
+        current.append(line)
+        current_size += line_size
+
+    if current:
+        batch_inputs.append(b"\n".join(current) + b"\n")
+
+    return batch_inputs
+
+
+async def _run_batch(client: AsyncOpenAI, batch_input: bytes) -> dict[str, str]:
+    """Submit a single batch job, wait for it and collect its visit notes.
+
+    The batch is cancelled if it fails, times out or the caller is cancelled,
+    and its input and output files are deleted from OpenAI file storage.
+
+    Args:
+        client: OpenAI client
+        batch_input: JSONL batch input file contents
+
+    Returns:
+        Generated visit notes keyed by request custom_id
+
+    Raises:
+        RuntimeError: If the batch job or any of its requests fails
+    """
+    custom_ids = [orjson.loads(line)["custom_id"] for line in batch_input.splitlines()]
+    file_ids = []
+    batch = None
+
+    try:
+        input_file = await client.files.create(
+            file=("visit_notes.jsonl", batch_input), purpose="batch"
+        )
+        file_ids.append(input_file.id)
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        logger.info(
+            "Submitted batch {batch_id} with {count} visit note requests",
+            batch_id=batch.id,
+            count=len(custom_ids),
+        )
+
+        deadline = time.monotonic() + BATCH_TIMEOUT_SECONDS
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Batch {batch.id} timed out: {batch.status}")
+            await asyncio.sleep(BATCH_POLL_INTERVAL_SECONDS)
+            batch = await client.batches.retrieve(batch.id)
+            logger.info(
+                "Batch {batch_id} status: {status}",
+                batch_id=batch.id,
+                status=batch.status,
+            )
+
+        file_ids.extend(
+            file_id
+            for file_id in (batch.output_file_id, batch.error_file_id)
+            if file_id is not None
+        )
+        if batch.status != "completed" or batch.output_file_id is None:
+            raise RuntimeError(f"Batch {batch.id} did not complete: {batch.status}")
+
+        output = await client.files.content(batch.output_file_id)
+        return _parse_batch_output(output.content, custom_ids)
+
+    except BaseException:
+        if batch is not None and batch.status not in BATCH_TERMINAL_STATUSES:
+            try:
+                await client.batches.cancel(batch.id)
+                logger.info("Cancelled batch {batch_id}", batch_id=batch.id)
+            except OpenAIError as e:
+                logger.error(f"Failed to cancel batch {batch.id}: {e}")
+        raise
+
+    finally:
+        for file_id in file_ids:
+            try:
+                await client.files.delete(file_id)
+            except OpenAIError as e:
+                logger.error(f"Failed to delete batch file {file_id}: {e}")
+
+
+def _parse_batch_output(content: bytes, custom_ids: list[str]) -> dict[str, str]:
+    """Parse a batch output file into visit notes.
+
+    Args:
+        content: JSONL batch output file contents
+        custom_ids: custom_ids of every request submitted in the batch
+
+    Returns:
+        Generated visit notes keyed by request custom_id
+
+    Raises:
+        RuntimeError: If any request failed, returned no content or is missing
+    """
+    # Output lines are not guaranteed to be in input order
+    notes: dict[str, str] = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        result = orjson.loads(line)
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            raise RuntimeError(
+                f"Batch request {result['custom_id']} failed: "
+                f"{result.get('error') or response.get('body')}"
+            )
+
+        message = response["body"]["choices"][0]["message"]
+        if not message.get("content"):
+            raise RuntimeError(
+                f"Batch request {result['custom_id']} returned no content: "
+                f"{message.get('refusal') or 'empty response'}"
+            )
+        notes[result["custom_id"]] = message["content"]
+
+    missing = [custom_id for custom_id in custom_ids if custom_id not in notes]
+    if missing:
+        raise RuntimeError(f"Missing visit notes in batch output: {missing}")
+
+    return notes
+
+
+def generate_patient_data(
+    n: int = 10, output_file: str | None = None, use_batch: bool = False
+) -> list[Patient]:
     """Generate mock patients with realistic data and visit notes.
 
     This is the main entry point for generating patient data. It creates
@@ -452,8 +985,10 @@ def generate_patient_data(n: int = 10, output_file: str | None = None) -> list[P
 
     Args:
         n: Number of patients to generate (default: 10)
-        output_file: Path to save JSON file. If None, saves to
-                    sample_data/patient_data.json
+        output_file: Path to save JSON (or JSONL, by ``.jsonl`` suffix) file.
+                    If None, saves to sample_data/patient_data.json
+        use_batch: Generate visit notes with the OpenAI Batch API instead of
+                   live requests (cheaper, but may take up to 24 hours)
 
     Returns:
         List of generated Patient objects
@@ -466,12 +1001,9 @@ def generate_patient_data(n: int = 10, output_file: str | None = None) -> list[P
         >>> print(f"Generated {len(patients)} patients")
         Generated 5 patients
     """
-    logger.info(f"Starting generation of {n} patients")
+    logger.info("Starting generation of {n} patients", n=n)
 
     try:
-        # Generate patients asynchronously for better performance
-        patients = asyncio.run(generate_patients_async(n))
-
         # Determine output path
         if output_file is None:
             output_file = _get_default_output_path()
@@ -480,18 +1012,14 @@ def generate_patient_data(n: int = 10, output_file: str | None = None) -> list[P
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to JSON-serializable format
-        patients_data = [patient.model_dump() for patient in patients]
-
-        # Write to file with proper error handling
-        try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(patients_data, f, indent=2, ensure_ascii=False)
-        except OSError as e:
-            logger.error(f"Failed to write output file: {e}")
-            raise RuntimeError(f"Could not write to {output_file}") from e
+        # Generate patients asynchronously, writing each one as it completes
+        patients = _run(_generate_to_file(n, output_path, use_batch))
 
-        logger.info(f"Successfully saved {len(patients)} patients to {output_file}")
+        logger.info(
+            "Successfully saved {count} patients to {output_file}",
+            count=len(patients),
+            output_file=output_file,
+        )
         return patients
 
     except Exception as e:
@@ -499,6 +1027,92 @@ def generate_patient_data(n: int = 10, output_file: str | None = None) -> list[P
         raise RuntimeError("Failed to generate patient data") from e
 
 
+async def _generate_to_file(
+    n: int, output_path: Path, use_batch: bool
+) -> list[Patient]:
+    """Generate patients and write them to a file incrementally.
+
+    A ``.jsonl`` output gets one compact JSON object per line; any other
+    suffix gets an indented JSON array, written one element at a time.
+    Patients are written to a ``.partial`` file next to the output, which only
+    replaces the output once every patient has been written, so a failed run
+    leaves any existing output untouched.
+
+    Args:
+        n: Number of patients to generate
+        output_path: Path of the output file
+        use_batch: Generate visit notes with the OpenAI Batch API
+
+    Returns:
+        List of generated Patient objects
+
+    Raises:
+        RuntimeError: If the output file cannot be written
+    """
+    if use_batch:
+        patients_iter = _iterate(await generate_patients_batch(n))
+    else:
+        patients_iter = stream_patients(n)
+
+    jsonl = output_path.suffix == ".jsonl"
+    partial_path = output_path.with_suffix(output_path.suffix + ".partial")
+    patients = []
+
+    try:
+        with open(partial_path, "w", encoding="utf-8") as f:
+            if not jsonl:
+                f.write("[\n")
+
+            async for patient in patients_iter:
+                if jsonl:
+                    f.write(patient.model_dump_json())
+                    f.write("\n")
+                else:
+                    if patients:
+                        f.write(",\n")
+                    f.write(patient.model_dump_json(indent=2))
+                patients.append(patient)
+
+            if not jsonl:
+                f.write("\n]\n")
+
+        os.replace(partial_path, output_path)
+    except OSError as e:
+        logger.error(f"Failed to write output file: {e}")
+        raise RuntimeError(f"Could not write to {output_path}") from e
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+    return patients
+
+
+async def _iterate(patients: list[Patient]) -> AsyncIterator[Patient]:
+    """Adapt an already generated list of patients to an async iterator.
+
+    Args:
+        patients: Generated patients
+
+    Yields:
+        Each patient in order
+    """
+    for patient in patients:
+        yield patient
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on uvloop when available, falling back to asyncio.
+
+    Args:
+        coro: Coroutine to run to completion
+
+    Returns:
+        Result of the coroutine
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def _get_default_output_path() -> str:
     """Get the default output path for patient data.
 
@@ -517,20 +1131,26 @@ def log_patient_summary(patient: Patient) -> None:
         patient: Patient object to summarize
     """
     logger.info("Patient Summary:")
-    logger.info(f"  Name: {patient.first_name} {patient.last_name}")
-    logger.info(f"  DOB: {patient.date_of_birth}")
-    logger.info(f"  Gender: {patient.gender}")
     logger.info(
-        f"  Prescription: {patient.prescription.medication} {patient.prescription.dosage}"
+        "  Name: {first_name} {last_name}",
+        first_name=patient.first_name,
+        last_name=patient.last_name,
     )
-    logger.info(f"  Frequency: {patient.prescription.frequency}")
-    logger.info(f"  Number of visit notes: {len(patient.visit_notes)}")
+    logger.info("  DOB: {date_of_birth}", date_of_birth=patient.date_of_birth)
+    logger.info("  Gender: {gender}", gender=patient.gender)
+    logger.info(
+        "  Prescription: {medication} {dosage}",
+        medication=patient.prescription.medication,
+        dosage=patient.prescription.dosage,
+    )
+    logger.info("  Frequency: {frequency}", frequency=patient.prescription.frequency)
+    logger.info("  Number of visit notes: {count}", count=len(patient.visit_notes))
 
     if patient.visit_notes:
         preview = patient.visit_notes[0][:VISIT_NOTE_PREVIEW_LENGTH]
         if len(patient.visit_notes[0]) > VISIT_NOTE_PREVIEW_LENGTH:
             preview += "..."
-        logger.info(f"First visit note preview:\n{preview}")
+        logger.info("First visit note preview:\n{preview}", preview=preview)
 
 
 def main() -> None:
@@ -555,7 +1175,12 @@ def main() -> None:
         "--output",
         type=str,
         default=None,
-        help="Output file path (default: sample_data/patient_data.json)",
+        help="Output file path, .jsonl for one patient per line (default: sample_data/patient_data.json)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Use the OpenAI Batch API (50%% cheaper, completes within 24 hours)",
     )
 
     # Parse arguments
@@ -567,8 +1192,8 @@ def main() -> None:
 
     try:
         # Generate sample patients
-        logger.info(f"Generating {args.number} patients...")
-        patients = generate_patient_data(args.number, args.output)
+        logger.info("Generating {n} patients...", n=args.number)
+        patients = generate_patient_data(args.number, args.output, args.batch)
 
         # Display example
         if patients:
@@ -1,36 +1,43 @@
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
+from pydantic_ai.messages import ModelMessage, ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
 
+from app.llm import get_answer_agent, is_visible
 from app.main import app
-from app.models import AnswerInput, Patient, Question, QuestionSet
+from app.models import AnswerInput, Question
 
 client = TestClient(app)
 
 
 # Create a fixture for loading test data from sample data directory
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data():
-    # Load patient data
-    with open("sample_data/patient_data.json") as f:
-        patients_data = json.load(f)
-
-    # Load question set
-    with open("sample_data/zepbound_question_set.json") as f:
-        questions_data = json.load(f)
-
-    # Use the first patient from the sample data and create Patient model
-    patient = Patient(**patients_data[0])
-
-    # Create Question models from the loaded data
-    questions = [Question(**q) for q in questions_data]
+    # Load patient data and question set concurrently
+    paths = [
+        Path("sample_data/patient_data.json"),
+        Path("sample_data/zepbound_question_set.json"),
+    ]
+    with ThreadPoolExecutor() as executor:
+        patients_data, questions_data = map(
+            orjson.loads, executor.map(Path.read_bytes, paths)
+        )
 
-    # Create QuestionSet model
-    question_set = QuestionSet(name="Zepbound Prior Authorization", questions=questions)
-
-    # Create AnswerInput model
-    answer_input = AnswerInput(patient=patient, question_set=question_set)
+    # Validate the first patient and the question set in a single pass
+    answer_input = AnswerInput.model_validate(
+        {
+            "patient": patients_data[0],
+            "question_set": {
+                "name": "Zepbound Prior Authorization",
+                "questions": questions_data,
+            },
+        }
+    )
 
     return answer_input
 
@@ -40,3 +47,88 @@ def test_get_answers(test_data):
     assert response.status_code == 200
     assert "answers" in response.json()
     assert len(response.json()["answers"]) > 0
+
+
+@pytest.fixture
+def answer_agent(monkeypatch):
+    # The model is overridden in tests, so any key lets the agent be built offline
+    monkeypatch.setenv("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY") or "test-key")
+    get_answer_agent.cache_clear()
+    yield get_answer_agent()
+    get_answer_agent.cache_clear()
+
+
+def test_get_answers_single_llm_call(test_data, answer_agent):
+    calls = []
+
+    def answer_all(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append(messages)
+        answers = [
+            {"key": q.key, "value": False if q.type == "boolean" else "Unknown"}
+            for q in test_data.question_set.questions
+        ]
+        for answer in answers:
+            if answer["key"] == "expedited_review":
+                answer["value"] = "true"
+        return ModelResponse(
+            parts=[ToolCallPart(info.output_tools[0].name, {"response": answers})]
+        )
+
+    with answer_agent.override(model=FunctionModel(answer_all)):
+        response = client.post("/answers", json=test_data.model_dump())
+
+    assert response.status_code == 200
+    assert len(calls) == 1
+
+    values = {a["question"]["key"]: a["value"] for a in response.json()["answers"]}
+    assert values["continuation"] is False
+    assert not [key for key in values if key.startswith("cont_")]
+    assert values["expedited_review"] is True
+
+
+def test_get_answers_boolean_strings(test_data, answer_agent):
+    questions = [
+        {"type": "boolean", "key": key, "content": key}
+        for key in ("answered_yes", "answered_no", "answered_maybe")
+    ]
+    generated = [
+        {"key": "answered_yes", "value": "Yes"},
+        {"key": "answered_no", "value": "no"},
+        {"key": "answered_maybe", "value": "maybe"},
+    ]
+
+    def answer_all(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        return ModelResponse(
+            parts=[ToolCallPart(info.output_tools[0].name, {"response": generated})]
+        )
+
+    payload = test_data.model_dump()
+    payload["question_set"]["questions"] = questions
+    with answer_agent.override(model=FunctionModel(answer_all)):
+        response = client.post("/answers", json=payload)
+
+    assert response.status_code == 200
+    values = {a["question"]["key"]: a["value"] for a in response.json()["answers"]}
+    assert values == {"answered_yes": True, "answered_no": False}
+
+
+def test_is_visible():
+    question = Question(
+        type="boolean",
+        key="cont_maintain_wl",
+        content="Has the patient maintained weight loss?",
+        visible_if="{continuation} = true and {cont_less_6m} = false",
+    )
+    assert is_visible(question, {"continuation": True, "cont_less_6m": False})
+    assert not is_visible(question, {"continuation": True, "cont_less_6m": True})
+    assert not is_visible(question, {"continuation": False})
+
+
+def test_is_visible_unsupported_condition():
+    question = Question(
+        type="boolean",
+        key="either",
+        content="Shown for either answer",
+        visible_if="{continuation} = true or {cont_less_6m} != false",
+    )
+    assert is_visible(question, {})
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import re
+
+import orjson
+import pytest
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from scripts import generate_patient_data as gpd
+
+
+def _output_line(custom_id, content="note", status_code=200, error=None):
+    return orjson.dumps(
+        {
+            "custom_id": custom_id,
+            "error": error,
+            "response": {
+                "status_code": status_code,
+                "body": {"choices": [{"message": {"content": content}}]},
+            },
+        }
+    )
+
+
+def test_split_batch_input_by_request_count(monkeypatch):
+    monkeypatch.setattr(gpd, "MAX_BATCH_REQUESTS", 3)
+
+    batch_inputs = gpd._split_batch_input([b"{}"] * 7)
+
+    assert [batch_input.count(b"\n") for batch_input in batch_inputs] == [3, 3, 1]
+
+
+def test_split_batch_input_by_file_size(monkeypatch):
+    monkeypatch.setattr(gpd, "MAX_BATCH_FILE_BYTES", 10)
+
+    batch_inputs = gpd._split_batch_input([b"abcd"] * 5)
+
+    assert batch_inputs == [b"abcd\nabcd\n", b"abcd\nabcd\n", b"abcd\n"]
+    assert all(len(batch_input) <= 10 for batch_input in batch_inputs)
+
+
+def test_parse_batch_output():
+    content = _output_line("0:1", "second") + b"\n" + _output_line("0:0", "first")
+
+    notes = gpd._parse_batch_output(content, ["0:0", "0:1"])
+
+    assert notes == {"0:0": "first", "0:1": "second"}
+
+
+def test_parse_batch_output_failed_request():
+    content = _output_line("0:0") + b"\n" + _output_line("0:1", status_code=500)
+
+    with pytest.raises(RuntimeError, match="0:1 failed"):
+        gpd._parse_batch_output(content, ["0:0", "0:1"])
+
+
+def test_parse_batch_output_missing_request():
+    with pytest.raises(RuntimeError, match="Missing visit notes"):
+        gpd._parse_batch_output(_output_line("0:0"), ["0:0", "0:1"])
+
+
+def test_parse_batch_output_refusal():
+    with pytest.raises(RuntimeError, match="0:0 returned no content"):
+        gpd._parse_batch_output(_output_line("0:0", content=None), ["0:0"])
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    # Models are overridden in tests, so any key lets the agents be built offline
+    monkeypatch.setenv("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY") or "test-key")
+    gpd._get_visit_note_agent.cache_clear()
+    yield gpd.PatientDataGenerator(expected_patients=1)
+    gpd._get_visit_note_agent.cache_clear()
+
+
+def _visit_number(messages: list[ModelMessage]) -> int:
+    prompt = messages[-1].parts[-1].content
+    return int(re.search(r"Visit Number: (\d+) of", prompt)[1])
+
+
+def test_generate_visit_notes_regenerates_rejected_follow_up(generator, monkeypatch):
+    monkeypatch.setattr(gpd, "MIN_VISITS", gpd.MAX_VISITS)
+    visit_note_request, _ = generator.build_visit_note_request()
+    visit_note_request = visit_note_request.model_copy(
+        update={"is_continuation": False, "months_on_medication": None}
+    )
+    last_name = visit_note_request.patient_last_name
+    large_model_visits = []
+
+    async def write_note(messages: list[ModelMessage], info: AgentInfo):
+        large_model_visits.append(_visit_number(messages))
+        yield f"Note for {last_name}. " + "x" * gpd.MIN_VISIT_NOTE_LENGTH
+
+    async def write_follow_up_note(messages: list[ModelMessage], info: AgentInfo):
+        if _visit_number(messages) == 2:
+            yield "Short note."
+        else:
+            yield f"Follow-up for {last_name}. " + "x" * gpd.MIN_VISIT_NOTE_LENGTH
+
+    with (
+        generator.visit_note_agent.override(
+            model=FunctionModel(stream_function=write_note)
+        ),
+        generator.follow_up_agent.override(
+            model=FunctionModel(stream_function=write_follow_up_note)
+        ),
+    ):
+        notes = asyncio.run(generator.generate_visit_notes(visit_note_request))
+
+    # Only the initial consultation and the rejected follow-up use the large model
+    assert sorted(large_model_visits) == [1, 2]
+    assert notes[1].startswith("Note for")
+    assert len(notes) == gpd.MAX_VISITS
+    assert all(note.startswith("Follow-up for") for note in notes[2:])